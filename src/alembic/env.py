@@ -5,7 +5,6 @@ This module configures Alembic to use either SpatiaLite (development)
 or PostGIS (production) based on the ENVIRONMENT setting.
 """
 
-import ctypes
 import os
 from logging.config import fileConfig
 from pathlib import Path
@@ -14,7 +13,7 @@ from dotenv import load_dotenv
 from sqlalchemy import create_engine, event, pool
 
 from alembic import context
-from app.db import Base
+from app.db import Base, _preload_spatialite, init_spatial_metadata
 from app.models import ExamplePoint  # noqa: F401 to register models
 
 # this is the Alembic Config object, which provides
@@ -42,17 +41,6 @@ else:
 
 config.set_main_option("sqlalchemy.url", database_url)
 
-# Path to local SpatiaLite DLLs (relative to repo root)
-SPATIALITE_DIR = (
-    Path(__file__).parent.parent.parent / "lib" / "mod_spatialite-5.1.0-win-amd64"
-)
-SPATIALITE_DLL = SPATIALITE_DIR / "mod_spatialite.dll"
-
-# Preload SpatiaLite DLL on Windows in development
-if os.name == "nt" and is_development:
-    os.add_dll_directory(str(SPATIALITE_DIR))
-    ctypes.CDLL(str(SPATIALITE_DLL))
-
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -125,16 +113,23 @@ def run_migrations_online() -> None:
         @event.listens_for(connectable, "connect")
         def load_spatialite(dbapi_conn, connection_record):
             """Load the SpatiaLite extension on each connection."""
+            _preload_spatialite()
             dbapi_conn.enable_load_extension(True)
             dbapi_conn.load_extension("mod_spatialite")
             dbapi_conn.enable_load_extension(False)
-            dbapi_conn.execute("SELECT InitSpatialMetaData(1);")
+            init_spatial_metadata(dbapi_conn)
 
     with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
             include_object=include_object,
+            # Single-schema comparison keeps autogenerate on the batched
+            # reflection path (one metadata query instead of one per
+            # table on SQLAlchemy 2.x / Alembic 1.13+).
+            include_schemas=False,
+            compare_type=True,
+            compare_server_default=True,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,33 @@
+"""add example_point geom index
+
+Revision ID: 8a4250cb0ee9
+Revises: 0249d898dac8
+Create Date: 2026-09-01 10:12:45.118734
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4250cb0ee9"
+down_revision: Union[str, Sequence[str], None] = "0249d898dac8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_example_point_geom",
+        "example_point",
+        ["geom"],
+        unique=False,
+        postgresql_using="gist",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_example_point_geom", table_name="example_point")
@@ -5,43 +5,132 @@ This module provides database operations for creating and retrieving
 spatial point data stored in PostGIS.
 """
 
-from geoalchemy2.shape import from_shape
-from shapely import wkt
-from sqlalchemy import func, select
+from collections.abc import Iterator
+
+from geoalchemy2 import WKTElement
+from sqlalchemy import Row, bindparam, func, insert, select
 from sqlalchemy.orm import Session
 
 from app.models import ExamplePoint
 from app.schemas import ExamplePointCreate
+from app.settings import settings
+
+# Bbox-only overlap filter for the backend in use. SQLite has no &&
+# operator in its grammar, so SpatiaLite development uses the equivalent
+# MbrIntersects/BuildMbr pair; PostGIS production uses && against an
+# ST_MakeEnvelope. Both compare bounding boxes only, which is exact for
+# POINT geometries.
+if settings.is_development:
+    _bbox_filter = func.MbrIntersects(
+        ExamplePoint.geom,
+        func.BuildMbr(
+            bindparam("min_lon"),
+            bindparam("min_lat"),
+            bindparam("max_lon"),
+            bindparam("max_lat"),
+            4326,
+        ),
+    )
+else:
+    _bbox_filter = ExamplePoint.geom.op("&&")(
+        func.ST_MakeEnvelope(
+            bindparam("min_lon"),
+            bindparam("min_lat"),
+            bindparam("max_lon"),
+            bindparam("max_lat"),
+            4326,
+        )
+    )
+
+# Built once at import so SQLAlchemy's compiled-statement cache is hit on
+# every execution instead of re-constructing and re-compiling the envelope
+# expression per request.
+_BBOX_STMT = (
+    select(ExamplePoint)
+    .where(_bbox_filter)
+    .order_by(ExamplePoint.id)
+    .limit(bindparam("limit"))
+    .offset(bindparam("offset"))
+)
 
 
 def create_example_point(db: Session, data: ExamplePointCreate) -> ExamplePoint:
     """
     Create a new point in the database.
 
-    Converts WKT geometry string to PostGIS-compatible format and
-    persists the point with its associated value.
+    Wraps the WKT geometry string in a WKTElement so the database parses
+    it once server-side, instead of round-tripping through a Shapely
+    parse and WKB re-encode in Python.
 
     :param db: SQLAlchemy database session.
     :param data: Pydantic schema containing point geometry and value.
     :return: The created ExamplePoint instance with populated id and created_at.
     :raises sqlalchemy.exc.SQLAlchemyError: If database operation fails.
     """
-    point_geom = from_shape(wkt.loads(data.geom), srid=4326)
-    db_obj = ExamplePoint(geom=point_geom, value=data.value)
+    db_obj = ExamplePoint(geom=WKTElement(data.geom, srid=4326), value=data.value)
     db.add(db_obj)
     db.commit()
-    db.refresh(db_obj)
     return db_obj
 
 
-def get_all_example_points(db: Session) -> list[ExamplePoint]:
+def create_example_points_bulk(
+    db: Session, items: list[ExamplePointCreate]
+) -> list[ExamplePoint]:
+    """
+    Create many points with a single bulk INSERT and one commit.
+
+    Amortises the commit/fsync cost across all rows instead of paying it
+    per point, which is dramatically faster for bulk ingest.
+
+    :param db: SQLAlchemy database session.
+    :param items: Pydantic schemas containing point geometries and values.
+    :return: The created ExamplePoint instances with populated ids.
+    :raises sqlalchemy.exc.SQLAlchemyError: If database operation fails.
+    """
+    if not items:
+        return []
+
+    rows = [
+        {"geom": WKTElement(item.geom, srid=4326), "value": item.value}
+        for item in items
+    ]
+    created = db.scalars(insert(ExamplePoint).returning(ExamplePoint), rows).all()
+    db.commit()
+    return created
+
+
+def get_all_example_points(
+    db: Session, limit: int = 100, offset: int = 0
+) -> Iterator[Row]:
     """
-    Retrieve all points from the database.
+    Stream a page of points from the database.
+
+    Selects the individual columns rather than the mapped entity, so rows
+    come back as plain Core Row tuples without ORM identity-map or
+    attribute-instrumentation overhead — the read-only endpoint never
+    mutates them. Rows are fetched in batches of 1000 via ``yield_per``,
+    so memory use is bounded by the batch size rather than the page size.
+    Results are ordered by id so pagination is stable across requests.
 
     :param db: SQLAlchemy database session.
-    :return: List of all ExamplePoint instances.
+    :param limit: Maximum number of points to return.
+    :param offset: Number of points to skip.
+    :return: Iterator over the requested page of point rows.
     """
-    return db.execute(select(ExamplePoint)).scalars().all()
+    stmt = (
+        select(
+            ExamplePoint.id,
+            ExamplePoint.created_at,
+            ExamplePoint.geom,
+            ExamplePoint.value,
+        )
+        .order_by(ExamplePoint.id)
+        .limit(limit)
+        .offset(offset)
+        .execution_options(yield_per=1000)
+    )
+
+    yield from db.execute(stmt)
 
 
 def get_example_points_in_bbox(
@@ -50,26 +139,36 @@ def get_example_points_in_bbox(
     max_lat: float,
     min_lon: float,
     max_lon: float,
+    limit: int = 100,
+    offset: int = 0,
 ) -> list[ExamplePoint]:
     """
     Retrieve points intersecting a bounding box (WGS84 / SRID 4326).
 
-    Uses a PostGIS envelope and ST_Intersects, which is index-friendly with
-    a GiST/SP-GiST index on the geometry column.
+    Uses a bounding-box overlap filter against an envelope — PostGIS's
+    ``&&`` operator in production, SpatiaLite's ``MbrIntersects`` in
+    development — which is index-friendly with a spatial index on the
+    geometry column. For POINT geometries bbox overlap is exact, so the
+    per-row ST_Intersects recheck is unnecessary. The statement itself is
+    prepared once at module load with bind parameters for the bounds and
+    page, so only parameter values vary per call.
 
     :param db: SQLAlchemy database session.
     :param min_lat: Minimum latitude (south bound).
     :param max_lat: Maximum latitude (north bound).
     :param min_lon: Minimum longitude (west bound).
     :param max_lon: Maximum longitude (east bound).
+    :param limit: Maximum number of points to return.
+    :param offset: Number of points to skip.
     :return: List of ExamplePoint instances inside/intersecting the bbox.
     """
-    envelope = func.ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326)
-
-    stmt = (
-        select(ExamplePoint)
-        .where(func.ST_Intersects(ExamplePoint.geom, envelope))
-        .order_by(ExamplePoint.id)
-    )
-
-    return db.execute(stmt).scalars().all()
+    params = {
+        "min_lon": min_lon,
+        "min_lat": min_lat,
+        "max_lon": max_lon,
+        "max_lat": max_lat,
+        "limit": limit,
+        "offset": offset,
+    }
+
+    return db.execute(_BBOX_STMT, params).scalars().all()
@@ -8,7 +8,7 @@ data using GeoAlchemy2 and PostGIS.
 from datetime import datetime, timezone
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Column, DateTime, Float, Integer
+from sqlalchemy import Column, DateTime, Float, Index, Integer
 
 from app.db import Base
 
@@ -41,5 +41,13 @@ class ExamplePoint(Base):
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
-    geom = Column(Geometry("POINT", srid=4326), nullable=False)
+    # spatial_index=False: the index is declared explicitly (and named)
+    # in __table_args__ below so it is visible to Alembic autogenerate.
+    geom = Column(Geometry("POINT", srid=4326, spatial_index=False), nullable=False)
     value = Column(Float, nullable=False)
+
+    __table_args__ = (Index("ix_example_point_geom", "geom", postgresql_using="gist"),)
+
+    # Fetch generated values (id) via INSERT ... RETURNING on the same
+    # round-trip instead of a follow-up SELECT.
+    __mapper_args__ = {"eager_defaults": True}
@@ -8,10 +8,12 @@ geospatial points.
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.crud import (
     create_example_point,
+    create_example_points_bulk,
     get_all_example_points,
     get_example_points_in_bbox,
 )
@@ -47,22 +49,71 @@ def create_point(payload: ExamplePointCreate, db: Session = Depends(get_db)):
     return create_example_point(db, payload)
 
 
-@router.get(
-    "/points",
-    summary="Retrieve all geospatial points.",
-    description="Return all stored geospatial points.",
+@router.post(
+    "/points/bulk",
+    summary="Create multiple geospatial points.",
+    description=(
+        "Create many geospatial points in a single bulk INSERT with one commit."
+    ),
     response_model=list[ExamplePointModel],
 )
-def read_points(db: Session = Depends(get_db)):
+def create_points_bulk(
+    payload: list[ExamplePointCreate], db: Session = Depends(get_db)
+):
     """
-    Retrieve all geospatial points.
+    Create multiple geospatial points in one transaction.
 
+    Accepts a list of WKT point strings with values and inserts them with
+    a single bulk INSERT, committing once for the whole batch.
+
+    :param payload: List of point data including WKT geometries and values.
+    :type payload: list[ExamplePointCreate]
     :param db: Database session dependency.
     :type db: Session
-    :returns: List of all point records.
+    :returns: The created point records.
     :rtype: list[ExamplePointModel]
     """
-    return get_all_example_points(db)
+    return create_example_points_bulk(db, payload)
+
+
+@router.get(
+    "/points",
+    summary="Retrieve a page of geospatial points.",
+    description=(
+        "Stream a page of stored geospatial points (up to `limit`, starting "
+        "at `offset`, ordered by id) as newline-delimited JSON "
+        "(one ExamplePointModel object per line)."
+    ),
+)
+def read_points(
+    limit: Annotated[
+        int, Query(description="Maximum number of points to return", ge=1, le=1000)
+    ] = 100,
+    offset: Annotated[int, Query(description="Number of points to skip", ge=0)] = 0,
+    db: Session = Depends(get_db),
+):
+    """
+    Stream a page of geospatial points as NDJSON.
+
+    Rows are streamed straight from the database in batches, so neither
+    the result set nor the serialised response is held in memory at once.
+
+    :param limit: Maximum number of points to return.
+    :type limit: int
+    :param offset: Number of points to skip.
+    :type offset: int
+    :param db: Database session dependency.
+    :type db: Session
+    :returns: NDJSON stream of point records.
+    :rtype: StreamingResponse
+    """
+    return StreamingResponse(
+        (
+            ExamplePointModel.model_validate(row._mapping).model_dump_json() + "\n"
+            for row in get_all_example_points(db, limit=limit, offset=offset)
+        ),
+        media_type="application/x-ndjson",
+    )
 
 
 @router.get(
@@ -76,6 +127,10 @@ def read_points_in_bbox(
     max_lat: Annotated[float, Query(description="Maximum latitude", ge=-90, le=90)],
     min_lon: Annotated[float, Query(description="Minimum longitude", ge=-180, le=180)],
     max_lon: Annotated[float, Query(description="Maximum longitude", ge=-180, le=180)],
+    limit: Annotated[
+        int, Query(description="Maximum number of points to return", ge=1, le=1000)
+    ] = 100,
+    offset: Annotated[int, Query(description="Number of points to skip", ge=0)] = 0,
     db: Session = Depends(get_db),
 ):
     """
@@ -92,6 +147,10 @@ def read_points_in_bbox(
     :type min_lon: float
     :param max_lon: Maximum longitude (east bound).
     :type max_lon: float
+    :param limit: Maximum number of points to return.
+    :type limit: int
+    :param offset: Number of points to skip.
+    :type offset: int
     :param db: Database session dependency.
     :type db: Session
     :returns: List of points inside/intersecting the bounding box.
@@ -109,4 +168,6 @@ def read_points_in_bbox(
         max_lat=max_lat,
         min_lon=min_lon,
         max_lon=max_lon,
+        limit=limit,
+        offset=offset,
     )
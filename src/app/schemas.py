@@ -5,12 +5,53 @@ This module defines the request and response schemas for the points API,
 handling serialisation between WKT strings and PostGIS geometry types.
 """
 
+import re
+import struct
 from datetime import datetime
 from typing import Optional
 
-from geoalchemy2 import WKBElement
+from geoalchemy2 import WKBElement, WKTElement
 from geoalchemy2.shape import to_shape
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SkipValidation, field_serializer, field_validator
+
+# Accepts 'POINT(lon lat)' with optional whitespace and signed decimals.
+_POINT_WKT_RE = re.compile(r"^POINT\s*\(\s*(-?\d+(?:\.\d+)?)\s+(-?\d+(?:\.\d+)?)\s*\)$")
+
+# WKB geometry type code for POINT and the EWKB flag marking an
+# embedded SRID (4 extra bytes after the type word).
+_WKB_POINT = 1
+_EWKB_SRID_FLAG = 0x20000000
+
+
+def _wkb_element_to_wkt(element: WKBElement) -> str:
+    """
+    Convert a WKBElement to WKT, decoding 2D points directly.
+
+    A POINT is a fixed-layout 21/25-byte WKB/EWKB record, so it can be
+    unpacked with ``struct`` instead of constructing a full Shapely
+    geometry per row. Anything that is not a plain 2D point falls back
+    to the Shapely conversion.
+
+    :param element: Geometry value from the database.
+    :type element: WKBElement
+    :returns: WKT string representation of the geometry.
+    :rtype: str
+    """
+    data = element.data
+    data = bytes.fromhex(data) if isinstance(data, str) else bytes(data)
+
+    endian = "<" if data[0] == 1 else ">"
+    (geom_type,) = struct.unpack_from(f"{endian}I", data, 1)
+    offset = 5
+    if geom_type & _EWKB_SRID_FLAG:
+        geom_type &= ~_EWKB_SRID_FLAG
+        offset += 4
+
+    if geom_type != _WKB_POINT:
+        return to_shape(element).wkt
+
+    x, y = struct.unpack_from(f"{endian}dd", data, offset)
+    return f"POINT({x} {y})"
 
 
 class ExamplePointCreate(BaseModel):
@@ -28,6 +69,26 @@ class ExamplePointCreate(BaseModel):
         ..., description="Numeric value for this point", examples=[10.5]
     )
 
+    @field_validator("geom")
+    @classmethod
+    def validate_wkt_point(cls, v):
+        """
+        Validate the WKT point format with a compiled regex.
+
+        Rejects malformed geometry at the schema boundary for the cost
+        of a regex match, instead of surfacing a database parse error
+        deep in the insert path.
+
+        :param v: WKT geometry string.
+        :type v: str
+        :returns: The validated WKT string, unchanged.
+        :rtype: str
+        :raises ValueError: If the string is not a WKT 2D point.
+        """
+        if not _POINT_WKT_RE.match(v):
+            raise ValueError("geom must be WKT of the form 'POINT(longitude latitude)'")
+        return v
+
 
 class ExamplePointModel(BaseModel):
     """
@@ -44,7 +105,9 @@ class ExamplePointModel(BaseModel):
 
     id: int
     created_at: Optional[datetime]
-    geom: str = Field(
+    # SkipValidation lets the raw WKBElement pass through validation
+    # untouched; conversion happens once, on the serialization fast-path.
+    geom: SkipValidation[str] = Field(
         ..., description="WKT Point geometry", examples=["POINT(-0.11944 51.50339)"]
     )
     value: float = Field(
@@ -53,17 +116,22 @@ class ExamplePointModel(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @field_validator("geom", mode="before")
-    @classmethod
-    def convert_wkb_to_wkt(cls, v):
+    @field_serializer("geom")
+    def convert_wkb_to_wkt(self, v):
         """
-        Convert PostGIS WKBElement to WKT string.
+        Convert PostGIS geometry elements to WKT strings on output.
+
+        A WKTElement appears here when serialising a freshly inserted
+        object whose geom attribute still holds the value sent to the
+        database; its data is already the WKT string.
 
-        :param v: Geometry value, either WKBElement or string.
-        :type v: WKBElement | str
+        :param v: Geometry value: WKBElement, WKTElement or string.
+        :type v: WKBElement | WKTElement | str
         :returns: WKT string representation of the geometry.
         :rtype: str
         """
         if isinstance(v, WKBElement):
-            return to_shape(v).wkt
+            return _wkb_element_to_wkt(v)
+        if isinstance(v, WKTElement):
+            return v.data
         return v
@@ -5,6 +5,8 @@ This module defines the application settings using Pydantic,
 loading configuration from environment variables and .env files.
 """
 
+from functools import cached_property
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -14,6 +16,7 @@ class Settings(BaseSettings):
     Application settings loaded from environment variables.
 
     :cvar ENVIRONMENT: Runtime environment (development or production).
+    :cvar DEBUG_SQL: Echo SQL statements to the log (off by default).
     :cvar SPATIALITE_PATH: Path to SpatiaLite database file for development.
     :cvar POSTGRES_USER: PostgreSQL username.
     :cvar POSTGRES_PASSWORD: PostgreSQL password.
@@ -23,6 +26,7 @@ class Settings(BaseSettings):
     """
 
     ENVIRONMENT: str = Field(default="development")
+    DEBUG_SQL: bool = Field(default=False)
     SPATIALITE_PATH: str = Field(default="./geo.db")
 
     POSTGRES_USER: str = Field(default="postgres")
@@ -31,28 +35,35 @@ class Settings(BaseSettings):
     POSTGRES_PORT: str = Field(default="5432")
     POSTGRES_DB: str = Field(default="postgres")
 
-    @property
+    @cached_property
     def is_development(self) -> bool:
         """
         Check if running in development mode.
 
+        Cached after the first access; the environment does not change
+        mid-run and this is read on every request that touches the
+        database.
+
         :returns: True if development environment.
         :rtype: bool
         """
         return self.ENVIRONMENT.lower() == "development"
 
-    @property
+    @cached_property
     def database_url(self) -> str:
         """
         Construct the database connection URL.
 
         Returns SpatiaLite path for development, PostgreSQL for production.
+        The SQLite URL uses the file: URI form with cache=shared so all
+        pooled connections in the process share one page cache instead of
+        each warming its own.
 
         :returns: SQLAlchemy-compatible database connection string.
         :rtype: str
         """
         if self.is_development:
-            return f"sqlite:///{self.SPATIALITE_PATH}"
+            return f"sqlite:///file:{self.SPATIALITE_PATH}?cache=shared&uri=true"
 
         return (
             f"postgresql+psycopg2://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}"